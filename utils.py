@@ -2,75 +2,194 @@ import sqlite3
 import json
 import requests
 from datetime import datetime, timedelta
+from functools import lru_cache
 import pandas as pd
+import numpy as np
 import os
+import threading
+import streamlit as st
 from reportlab.lib.pagesizes import letter, A4
 from reportlab.lib.units import inch
 from reportlab.platypus import SimpleDocTemplate, Paragraph, Spacer, Table, TableStyle, PageBreak
 from reportlab.lib.styles import getSampleStyleSheet, ParagraphStyle
 from reportlab.lib.enums import TA_CENTER, TA_LEFT
 from reportlab.lib import colors
-import matplotlib.pyplot as plt
-import matplotlib
-matplotlib.use('Agg')
 import io
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 DB_FILE = "data_cache.db"
 OFFLINE_DATA_FILE = "offline_data.json"
 
+_STYLES = getSampleStyleSheet()
+
+_TITLE_STYLE = ParagraphStyle(
+    'CustomTitle',
+    parent=_STYLES['Heading1'],
+    fontSize=18,
+    textColor=colors.HexColor('#1f77b4'),
+    spaceAfter=12,
+    alignment=TA_CENTER,
+    fontName='Helvetica-Bold'
+)
+
+_HEADING_STYLE = ParagraphStyle(
+    'CustomHeading',
+    parent=_STYLES['Heading2'],
+    fontSize=14,
+    textColor=colors.HexColor('#2c3e50'),
+    spaceAfter=10,
+    fontName='Helvetica-Bold'
+)
+
+_METRICS_TABLE_STYLE = TableStyle([
+    ('BACKGROUND', (0, 0), (-1, 0), colors.HexColor('#1f77b4')),
+    ('TEXTCOLOR', (0, 0), (-1, 0), colors.whitesmoke),
+    ('ALIGN', (0, 0), (-1, -1), 'LEFT'),
+    ('FONTNAME', (0, 0), (-1, 0), 'Helvetica-Bold'),
+    ('FONTSIZE', (0, 0), (-1, 0), 12),
+    ('BOTTOMPADDING', (0, 0), (-1, 0), 12),
+    ('BACKGROUND', (0, 1), (-1, -1), colors.beige),
+    ('GRID', (0, 0), (-1, -1), 1, colors.black)
+])
+
+_TREND_TABLE_STYLE = TableStyle([
+    ('BACKGROUND', (0, 0), (-1, 0), colors.HexColor('#2ca02c')),
+    ('TEXTCOLOR', (0, 0), (-1, 0), colors.whitesmoke),
+    ('ALIGN', (0, 0), (-1, -1), 'CENTER'),
+    ('FONTNAME', (0, 0), (-1, 0), 'Helvetica-Bold'),
+    ('FONTSIZE', (0, 0), (-1, 0), 9),
+    ('FONTSIZE', (0, 1), (-1, -1), 8),
+    ('BOTTOMPADDING', (0, 0), (-1, 0), 8),
+    ('BACKGROUND', (0, 1), (-1, -1), colors.lightgrey),
+    ('GRID', (0, 0), (-1, -1), 0.5, colors.black)
+])
+
+_MONTHS = (
+    "", "January", "February", "March", "April",
+    "May", "June", "July", "August",
+    "September", "October", "November", "December"
+)
+
+RECORD_COLUMNS = ['year', 'month', 'households', 'person_days', 'expenditure', 'avg_wage']
+
+METRIC_DTYPES = {
+    'households': 'Int32',
+    'person_days': 'Int64',
+    'expenditure': 'float64',
+    'avg_wage': 'float64',
+    'year': 'int16',
+    'month': 'int8'
+}
+
+_local = threading.local()
+
+def _conn():
+    """Per-thread SQLite connection; Streamlit reruns on a fresh thread, so it lives for one rerun"""
+    conn = getattr(_local, 'conn', None)
+    if conn is None:
+        conn = sqlite3.connect(DB_FILE)
+        conn.execute("PRAGMA synchronous=NORMAL")
+        conn.execute("PRAGMA temp_store=MEMORY")
+        conn.execute("PRAGMA mmap_size=268435456")
+        conn.execute("PRAGMA cache_size=-20000")
+        _local.conn = conn
+    return conn
+
+@st.cache_resource
 def init_database():
-    """Initialize SQLite database with district_metrics table"""
-    conn = sqlite3.connect(DB_FILE)
-    cursor = conn.cursor()
-    cursor.execute('''
-        CREATE TABLE IF NOT EXISTS district_metrics (
-            id INTEGER PRIMARY KEY AUTOINCREMENT,
-            state TEXT NOT NULL,
-            district TEXT NOT NULL,
-            year INTEGER NOT NULL,
-            month INTEGER NOT NULL,
-            households INTEGER,
-            person_days INTEGER,
-            expenditure REAL,
-            avg_wage REAL,
-            updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
-            UNIQUE(state, district, year, month)
-        )
-    ''')
-    conn.commit()
-    conn.close()
+    """Initialize SQLite database and load offline_data.json into offline_metrics, once per process"""
+    conn = _conn()
+    conn.execute("PRAGMA journal_mode=WAL")
+    with conn:
+        conn.execute('''
+            CREATE TABLE IF NOT EXISTS district_metrics (
+                id INTEGER PRIMARY KEY AUTOINCREMENT,
+                state TEXT NOT NULL,
+                district TEXT NOT NULL,
+                year INTEGER NOT NULL,
+                month INTEGER NOT NULL,
+                households INTEGER,
+                person_days INTEGER,
+                expenditure REAL,
+                avg_wage REAL,
+                updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+                UNIQUE(state, district, year, month)
+            )
+        ''')
+        conn.execute('''
+            CREATE INDEX IF NOT EXISTS idx_state_period
+            ON district_metrics(state, year, month)
+        ''')
+        conn.execute('''
+            CREATE TABLE IF NOT EXISTS offline_metrics (
+                state TEXT NOT NULL,
+                district TEXT NOT NULL,
+                year INTEGER NOT NULL,
+                month INTEGER NOT NULL,
+                households INTEGER,
+                person_days INTEGER,
+                expenditure REAL,
+                avg_wage REAL,
+                UNIQUE(state, district, year, month)
+            )
+        ''')
+        
+        offline_rows = conn.execute('SELECT COUNT(*) FROM offline_metrics').fetchone()[0]
+        if offline_rows == 0 and os.path.exists(OFFLINE_DATA_FILE):
+            with open(OFFLINE_DATA_FILE, 'rb') as f:
+                raw = f.read()
+            data = orjson.loads(raw) if orjson else json.loads(raw)
+            rows = [
+                (
+                    record['state'],
+                    record['district'],
+                    record['year'],
+                    record['month'],
+                    record['households'],
+                    record['person_days'],
+                    record['expenditure'],
+                    record['avg_wage']
+                )
+                for record in data
+            ]
+            conn.executemany('''
+                INSERT OR IGNORE INTO offline_metrics 
+                (state, district, year, month, households, person_days, expenditure, avg_wage)
+                VALUES (?, ?, ?, ?, ?, ?, ?, ?)
+            ''', rows)
 
 def get_cache_timestamp(state, district):
     """Get the timestamp of the last cache update for a state/district"""
-    conn = sqlite3.connect(DB_FILE)
-    cursor = conn.cursor()
-    cursor.execute('''
-        SELECT MAX(updated_at) FROM district_metrics 
-        WHERE state = ? AND district = ?
-    ''', (state, district))
-    result = cursor.fetchone()
-    conn.close()
+    with _conn() as conn:
+        result = conn.execute('''
+            SELECT MAX(updated_at) FROM district_metrics
+            WHERE state = ? AND district = ?
+        ''', (state, district)).fetchone()
     return result[0] if result[0] else None
 
-def is_cache_valid(state, district, ttl_seconds=86400):
-    """Check if cache is still valid (within TTL)"""
-    timestamp = get_cache_timestamp(state, district)
-    if not timestamp:
-        return False
-    cache_time = datetime.strptime(timestamp, '%Y-%m-%d %H:%M:%S')
-    return (datetime.now() - cache_time).total_seconds() < ttl_seconds
+def cache_bucket():
+    """Start of the current daily refresh window, shared by all sessions"""
+    return datetime.now().strftime('%Y-%m-%d')
+
+def is_cache_valid(state, district):
+    """Check if cache was refreshed within the current daily bucket"""
+    with _conn() as conn:
+        result = conn.execute('''
+            SELECT 1 FROM district_metrics
+            WHERE state = ? AND district = ? AND updated_at >= ?
+            LIMIT 1
+        ''', (state, district, cache_bucket())).fetchone()
+    return result is not None
 
 def save_to_cache(state, district, data_list):
     """Save fetched data to SQLite cache"""
-    conn = sqlite3.connect(DB_FILE)
-    cursor = conn.cursor()
-    
-    for record in data_list:
-        cursor.execute('''
-            INSERT OR REPLACE INTO district_metrics 
-            (state, district, year, month, households, person_days, expenditure, avg_wage, updated_at)
-            VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
-        ''', (
+    updated_at = datetime.now().strftime('%Y-%m-%d %H:%M:%S')
+    rows = [
+        (
             state,
             district,
             record['year'],
@@ -79,41 +198,87 @@ def save_to_cache(state, district, data_list):
             record['person_days'],
             record['expenditure'],
             record['avg_wage'],
-            datetime.now().strftime('%Y-%m-%d %H:%M:%S')
-        ))
+            updated_at
+        )
+        for record in data_list
+    ]
     
-    conn.commit()
-    conn.close()
+    with _conn() as conn:
+        conn.executemany('''
+            INSERT OR REPLACE INTO district_metrics 
+            (state, district, year, month, households, person_days, expenditure, avg_wage, updated_at)
+            VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
+        ''', rows)
+
+    _clear_cache_readers()
+
+def save_offline_to_cache(state, district):
+    """Copy a district's offline rows into the SQLite cache as stored, without dtype casts"""
+    updated_at = datetime.now().strftime('%Y-%m-%d %H:%M:%S')
+    with _conn() as conn:
+        conn.execute('''
+            INSERT OR REPLACE INTO district_metrics
+            (state, district, year, month, households, person_days, expenditure, avg_wage, updated_at)
+            SELECT state, district, year, month, households, person_days, expenditure, avg_wage, ?
+            FROM offline_metrics
+            WHERE state = ? AND district = ?
+        ''', (updated_at, state, district))
 
+    _clear_cache_readers()
+
+def _clear_cache_readers():
+    """Invalidate the memoized district_metrics queries after a write"""
+    get_from_cache.clear()
+    get_all_states_from_cache.clear()
+    get_districts_from_cache.clear()
+    get_state_averages_batch.clear()
+
+def _metrics_frame(cursor):
+    """Build a narrowly typed DataFrame from an executed district_metrics query"""
+    columns = [col[0] for col in cursor.description]
+    df = pd.DataFrame.from_records(cursor.fetchall(), columns=columns, coerce_float=True)
+    return df.astype(METRIC_DTYPES)
+
+@st.cache_data(ttl=3600, max_entries=128)
 def get_from_cache(state, district):
     """Retrieve data from SQLite cache"""
-    conn = sqlite3.connect(DB_FILE)
-    df = pd.read_sql_query('''
-        SELECT state, district, year, month, households, person_days, expenditure, avg_wage, updated_at
-        FROM district_metrics
-        WHERE state = ? AND district = ?
-        ORDER BY year DESC, month DESC
-    ''', conn, params=(state, district))
-    conn.close()
-    return df
+    with _conn() as conn:
+        cursor = conn.execute('''
+            SELECT state, district, year, month, households, person_days, expenditure, avg_wage, updated_at
+            FROM district_metrics
+            WHERE state = ? AND district = ?
+            ORDER BY year DESC, month DESC
+        ''', (state, district))
+        return _metrics_frame(cursor)
 
+def get_districts_data_batch(state, districts):
+    """Retrieve cached data for several districts of a state in one query"""
+    if not districts:
+        return {}
+    placeholders = ",".join("?" * len(districts))
+    with _conn() as conn:
+        cursor = conn.execute(f'''
+            SELECT state, district, year, month, households, person_days, expenditure, avg_wage, updated_at
+            FROM district_metrics
+            WHERE state = ? AND district IN ({placeholders})
+            ORDER BY year DESC, month DESC
+        ''', (state, *districts))
+        df = _metrics_frame(cursor)
+    return {district: group for district, group in df.groupby('district', sort=False)}
+
+@st.cache_data(ttl=300)
 def get_all_states_from_cache():
     """Get list of all states from cache"""
-    conn = sqlite3.connect(DB_FILE)
-    cursor = conn.cursor()
-    cursor.execute('SELECT DISTINCT state FROM district_metrics ORDER BY state')
-    states = [row[0] for row in cursor.fetchall()]
-    conn.close()
-    return states
+    with _conn() as conn:
+        rows = conn.execute('SELECT DISTINCT state FROM district_metrics ORDER BY state').fetchall()
+    return [row[0] for row in rows]
 
+@st.cache_data(ttl=300)
 def get_districts_from_cache(state):
     """Get list of all districts for a state from cache"""
-    conn = sqlite3.connect(DB_FILE)
-    cursor = conn.cursor()
-    cursor.execute('SELECT DISTINCT district FROM district_metrics WHERE state = ? ORDER BY district', (state,))
-    districts = [row[0] for row in cursor.fetchall()]
-    conn.close()
-    return districts
+    with _conn() as conn:
+        rows = conn.execute('SELECT DISTINCT district FROM district_metrics WHERE state = ? ORDER BY district', (state,)).fetchall()
+    return [row[0] for row in rows]
 
 def fetch_from_api(state, district=None, api_key=None):
     """
@@ -135,49 +300,54 @@ def fetch_from_api(state, district=None, api_key=None):
         print(f"API Error: {e}")
         return None
 
+@st.cache_data(ttl=None)
 def load_offline_data(state, district=None):
-    """Load fallback data from offline_data.json"""
-    if not os.path.exists(OFFLINE_DATA_FILE):
-        return pd.DataFrame()
-    
-    with open(OFFLINE_DATA_FILE, 'r', encoding='utf-8') as f:
-        data = json.load(f)
-    
-    if district:
-        filtered = [
-            record for record in data 
-            if record['state'] == state and record['district'] == district
-        ]
-    else:
-        filtered = [
-            record for record in data 
-            if record['state'] == state
-        ]
-    
-    return pd.DataFrame(filtered)
+    """Load fallback data imported from offline_data.json"""
+    with _conn() as conn:
+        if district:
+            cursor = conn.execute('''
+                SELECT state, district, year, month, households, person_days, expenditure, avg_wage
+                FROM offline_metrics
+                WHERE state = ? AND district = ?
+                ORDER BY year DESC, month DESC
+            ''', (state, district))
+        else:
+            cursor = conn.execute('''
+                SELECT state, district, year, month, households, person_days, expenditure, avg_wage
+                FROM offline_metrics
+                WHERE state = ?
+                ORDER BY district, year DESC, month DESC
+            ''', (state,))
+        return _metrics_frame(cursor)
 
+@st.cache_data(ttl=None)
 def get_districts_from_offline(state):
-    """Get list of all districts for a state from offline_data.json"""
-    df = load_offline_data(state)
-    if df.empty:
-        return []
-    return sorted(df['district'].unique().tolist())
+    """Get list of all districts for a state from the offline data"""
+    with _conn() as conn:
+        rows = conn.execute('SELECT DISTINCT district FROM offline_metrics WHERE state = ? ORDER BY district', (state,)).fetchall()
+    return [row[0] for row in rows]
+
+@st.cache_data(ttl=300)
+def get_state_averages_batch(state):
+    """Calculate state averages for every month of a state in one grouped query"""
+    with _conn() as conn:
+        rows = conn.execute('''
+            SELECT 
+                year,
+                month,
+                AVG(households) as avg_households,
+                AVG(person_days) as avg_person_days,
+                AVG(expenditure) as avg_expenditure,
+                AVG(avg_wage) as avg_avg_wage
+            FROM district_metrics
+            WHERE state = ?
+            GROUP BY year, month
+        ''', (state,)).fetchall()
+    return {(row[0], row[1]): row[2:] for row in rows}
 
 def get_state_average(state, year, month):
     """Calculate state average for comparison"""
-    conn = sqlite3.connect(DB_FILE)
-    cursor = conn.cursor()
-    cursor.execute('''
-        SELECT 
-            AVG(households) as avg_households,
-            AVG(person_days) as avg_person_days,
-            AVG(expenditure) as avg_expenditure,
-            AVG(avg_wage) as avg_avg_wage
-        FROM district_metrics
-        WHERE state = ? AND year = ? AND month = ?
-    ''', (state, year, month))
-    result = cursor.fetchone()
-    conn.close()
+    result = get_state_averages_batch(state).get((int(year), int(month)))
     
     if result and result[0]:
         return {
@@ -197,14 +367,22 @@ def format_indian_number(num):
     else:
         return f"{num:,.0f}"
 
+def format_indian_number_array(values):
+    """Vectorized format_indian_number for a whole column of numbers"""
+    x = np.asarray(values, dtype=np.float64)
+    crore = x >= 10000000
+    lakh = (x >= 100000) & ~crore
+    rest = ~(crore | lakh)
+    
+    out = np.empty(x.shape, dtype=object)
+    out[crore] = [f"₹{v:.2f} Cr" for v in x[crore] / 10000000]
+    out[lakh] = [f"{v:.2f} L" for v in x[lakh] / 100000]
+    out[rest] = [f"{v:,.0f}" for v in x[rest]]
+    return out
+
 def get_month_name(month_num):
     """Get month name from number"""
-    months = {
-        1: "January", 2: "February", 3: "March", 4: "April",
-        5: "May", 6: "June", 7: "July", 8: "August",
-        9: "September", 10: "October", 11: "November", 12: "December"
-    }
-    return months.get(month_num, "")
+    return _MONTHS[int(month_num)] if 1 <= month_num <= 12 else ""
 
 def get_translations():
     """Return English to Hindi translations for UI labels"""
@@ -252,36 +430,173 @@ def get_translations():
         'read_summary': {
             'en': 'Read Summary',
             'hi': 'सारांश सुनें'
+        },
+        'metric_guide': {
+            'en': 'Detailed Metric Guide',
+            'hi': 'विस्तृत मैट्रिक गाइड'
+        },
+        'location_help': {
+            'en': "Can't find your district? Enter your city/town name:",
+            'hi': 'अपना जिला नहीं मिल रहा? अपने शहर/कस्बे का नाम दर्ज करें:'
+        },
+        'city_town_village': {
+            'en': 'City/Town/Village',
+            'hi': 'शहर/कस्बा/गांव'
+        },
+        'location_placeholder': {
+            'en': 'e.g., Gomti Nagar, Varanasi Cantt, etc.',
+            'hi': 'उदाहरण: गोमती नगर, वाराणसी छावनी, आदि'
+        },
+        'suggested_districts': {
+            'en': 'Suggested district(s):',
+            'hi': 'सुझाया गया जिला:'
+        },
+        'select_from_dropdown': {
+            'en': 'Please select from the dropdown above',
+            'hi': 'कृपया ऊपर ड्रॉपडाउन से चुनें'
+        },
+        'no_matching_district': {
+            'en': 'No matching district found. Please try a different location or select manually.',
+            'hi': 'कोई मेल खाता जिला नहीं मिला। कृपया एक अलग स्थान आज़माएं या मैन्युअल रूप से चुनें।'
+        },
+        'download_pdf': {
+            'en': 'Download PDF Report',
+            'hi': 'PDF रिपोर्ट डाउनलोड करें'
+        },
+        'historical_trends': {
+            'en': 'Historical Trends & Year-over-Year Analysis',
+            'hi': 'ऐतिहासिक रुझान और वर्ष-दर-वर्ष विश्लेषण'
+        },
+        'yoy_comparison': {
+            'en': 'Year-over-Year Comparison',
+            'hi': 'वर्ष-दर-वर्ष तुलना'
+        },
+        'person_days_yoy': {
+            'en': 'Person-Days: Year-over-Year',
+            'hi': 'कार्य दिवस: वर्ष-दर-वर्ष'
+        },
+        'households_yoy': {
+            'en': 'Households: Year-over-Year',
+            'hi': 'परिवार: वर्ष-दर-वर्ष'
+        },
+        'seasonal_patterns': {
+            'en': 'Seasonal Patterns',
+            'hi': 'मौसमी पैटर्न'
+        },
+        'avg_person_days_by_month': {
+            'en': 'Average Person-Days by Month',
+            'hi': 'महीने के अनुसार औसत कार्य दिवस'
+        },
+        'avg_expenditure_by_month': {
+            'en': 'Average Expenditure by Month',
+            'hi': 'महीने के अनुसार औसत व्यय'
+        },
+        'multiple_years_required': {
+            'en': 'Multiple years of data required for year-over-year analysis',
+            'hi': 'वर्ष-दर-वर्ष विश्लेषण के लिए कई वर्षों का डेटा आवश्यक है'
+        },
+        'compare_districts': {
+            'en': 'Compare Multiple Districts',
+            'hi': 'कई जिलों की तुलना करें'
+        },
+        'select_districts_to_compare': {
+            'en': 'Select districts to compare',
+            'hi': 'तुलना के लिए जिले चुनें'
+        },
+        'district_comparison': {
+            'en': 'District Comparison',
+            'hi': 'जिला तुलना'
+        },
+        'comparison_table': {
+            'en': 'Comparison Table',
+            'hi': 'तुलना तालिका'
+        },
+        'select_at_least_two': {
+            'en': 'Please select at least 2 districts to compare',
+            'hi': 'तुलना के लिए कम से कम 2 जिले चुनें'
+        },
+        'select_districts_from_dropdown': {
+            'en': 'Select districts from the dropdown above',
+            'hi': 'ऊपर ड्रॉपडाउन से जिले चुनें'
+        },
+        'month': {
+            'en': 'Month',
+            'hi': 'महीना'
+        },
+        'district': {
+            'en': 'District',
+            'hi': 'जिला'
+        },
+        'districts': {
+            'en': 'Districts',
+            'hi': 'जिले'
+        },
+        'households_short': {
+            'en': 'Households',
+            'hi': 'परिवार'
+        },
+        'person_days_short': {
+            'en': 'Person-Days',
+            'hi': 'कार्य दिवस'
+        },
+        'avg_person_days': {
+            'en': 'Avg Person-Days',
+            'hi': 'औसत कार्य दिवस'
+        },
+        'avg_expenditure': {
+            'en': 'Avg Expenditure (₹)',
+            'hi': 'औसत व्यय (₹)'
+        },
+        'count': {
+            'en': 'Count',
+            'hi': 'संख्या'
+        },
+        'amount': {
+            'en': 'Amount (₹)',
+            'hi': 'राशि (₹)'
+        },
+        'wage_per_day': {
+            'en': 'Wage per Day (₹)',
+            'hi': 'प्रति दिन वेतन (₹)'
         }
     }
 
+@lru_cache(maxsize=None)
+def get_localized(lang):
+    """Return the UI labels for a single language as a flat dict"""
+    return {key: labels[lang] for key, labels in get_translations().items()}
+
+def _first_record(df):
+    """Return the first row's RECORD_COLUMNS as plain Python values"""
+    return next(df[RECORD_COLUMNS].head(1).itertuples(index=False, name=None))
+
 def generate_summary(district, state, latest_data, language='en'):
     """Generate performance summary text in English or Hindi"""
     if latest_data.empty:
         return "No data available" if language == 'en' else "कोई डेटा उपलब्ध नहीं है"
     
-    row = latest_data.iloc[0]
-    month_name = get_month_name(row['month'])
-    households = f"{row['households']:,}"
-    person_days = format_indian_number(row['person_days'])
-    expenditure = format_indian_number(row['expenditure'])
+    year, month, households_count, person_days_count, expenditure_amount, avg_wage = _first_record(latest_data)
+    month_name = get_month_name(month)
+    households = f"{households_count:,}"
+    person_days = format_indian_number(person_days_count)
+    expenditure = format_indian_number(expenditure_amount)
     
     if language == 'en':
-        summary = f"In {month_name} {row['year']}, {households} households in {district} district worked under MGNREGA, "
+        summary = f"In {month_name} {year}, {households} households in {district} district worked under MGNREGA, "
         summary += f"generating {person_days} person-days and ₹{expenditure} expenditure. "
-        summary += f"The average wage was ₹{row['avg_wage']:.2f} per day."
+        summary += f"The average wage was ₹{avg_wage:.2f} per day."
         
         if len(latest_data) > 1:
-            prev_row = latest_data.iloc[1]
-            change = ((row['person_days'] - prev_row['person_days']) / prev_row['person_days']) * 100
+            prev_person_days = latest_data['person_days'].iat[1]
+            change = ((person_days_count - prev_person_days) / prev_person_days) * 100
             if change > 0:
                 summary += f" This is a {change:.1f}% increase from the previous month."
             elif change < 0:
                 summary += f" This is a {abs(change):.1f}% decrease from the previous month."
     else:
-        summary = f"{month_name} {row['year']} में, {district} जिले में {households} परिवारों ने मनरेगा के तहत काम किया, "
+        summary = f"{month_name} {year} में, {district} जिले में {households} परिवारों ने मनरेगा के तहत काम किया, "
         summary += f"जिससे {person_days} कार्य दिवस और ₹{expenditure} खर्च हुए। "
-        summary += f"औसत वेतन ₹{row['avg_wage']:.2f} प्रति दिन था।"
+        summary += f"औसत वेतन ₹{avg_wage:.2f} प्रति दिन था।"
     
     return summary
 
@@ -294,27 +609,6 @@ def generate_pdf_report(district, state, df, language='en'):
     doc = SimpleDocTemplate(buffer, pagesize=A4, rightMargin=30, leftMargin=30, topMargin=30, bottomMargin=18)
     
     story = []
-    styles = getSampleStyleSheet()
-    
-    title_style = ParagraphStyle(
-        'CustomTitle',
-        parent=styles['Heading1'],
-        fontSize=18,
-        textColor=colors.HexColor('#1f77b4'),
-        spaceAfter=12,
-        alignment=TA_CENTER,
-        fontName='Helvetica-Bold'
-    )
-    
-    heading_style = ParagraphStyle(
-        'CustomHeading',
-        parent=styles['Heading2'],
-        fontSize=14,
-        textColor=colors.HexColor('#2c3e50'),
-        spaceAfter=10,
-        fontName='Helvetica-Bold'
-    )
-    
     if language == 'en':
         title_text = f"MGNREGA Performance Report<br/>{district}, {state}"
         subtitle_text = f"Report Generated: {datetime.now().strftime('%B %d, %Y')}"
@@ -322,79 +616,61 @@ def generate_pdf_report(district, state, df, language='en'):
         title_text = f"मनरेगा प्रदर्शन रिपोर्ट<br/>{district}, {state}"
         subtitle_text = f"रिपोर्ट तैयार: {datetime.now().strftime('%d/%m/%Y')}"
     
-    story.append(Paragraph(title_text, title_style))
-    story.append(Paragraph(subtitle_text, styles['Normal']))
+    story.append(Paragraph(title_text, _TITLE_STYLE))
+    story.append(Paragraph(subtitle_text, _STYLES['Normal']))
     story.append(Spacer(1, 0.3*inch))
     
-    latest_record = df.iloc[0]
-    month_name = get_month_name(latest_record['month'])
+    year, month, households, person_days, expenditure, avg_wage = _first_record(df)
+    month_name = get_month_name(month)
     
     if language == 'en':
-        story.append(Paragraph("Key Metrics Summary", heading_style))
+        story.append(Paragraph("Key Metrics Summary", _HEADING_STYLE))
         metrics_data = [
             ['Metric', 'Value'],
-            ['Latest Month', f"{month_name} {latest_record['year']}"],
-            ['Households Worked', f"{latest_record['households']:,}"],
-            ['Person-Days Generated', f"{latest_record['person_days']:,}"],
-            ['Total Expenditure', format_indian_number(latest_record['expenditure'])],
-            ['Average Wage', f"₹{latest_record['avg_wage']:.2f}"]
+            ['Latest Month', f"{month_name} {year}"],
+            ['Households Worked', f"{households:,}"],
+            ['Person-Days Generated', f"{person_days:,}"],
+            ['Total Expenditure', format_indian_number(expenditure)],
+            ['Average Wage', f"₹{avg_wage:.2f}"]
         ]
     else:
-        story.append(Paragraph("मुख्य मैट्रिक्स सारांश", heading_style))
+        story.append(Paragraph("मुख्य मैट्रिक्स सारांश", _HEADING_STYLE))
         metrics_data = [
             ['मैट्रिक', 'मूल्य'],
-            ['नवीनतम महीना', f"{month_name} {latest_record['year']}"],
-            ['कुल परिवार', f"{latest_record['households']:,}"],
-            ['कार्य दिवस', f"{latest_record['person_days']:,}"],
-            ['कुल व्यय', format_indian_number(latest_record['expenditure'])],
-            ['औसत वेतन', f"₹{latest_record['avg_wage']:.2f}"]
+            ['नवीनतम महीना', f"{month_name} {year}"],
+            ['कुल परिवार', f"{households:,}"],
+            ['कार्य दिवस', f"{person_days:,}"],
+            ['कुल व्यय', format_indian_number(expenditure)],
+            ['औसत वेतन', f"₹{avg_wage:.2f}"]
         ]
     
     metrics_table = Table(metrics_data, colWidths=[3*inch, 3*inch])
-    metrics_table.setStyle(TableStyle([
-        ('BACKGROUND', (0, 0), (-1, 0), colors.HexColor('#1f77b4')),
-        ('TEXTCOLOR', (0, 0), (-1, 0), colors.whitesmoke),
-        ('ALIGN', (0, 0), (-1, -1), 'LEFT'),
-        ('FONTNAME', (0, 0), (-1, 0), 'Helvetica-Bold'),
-        ('FONTSIZE', (0, 0), (-1, 0), 12),
-        ('BOTTOMPADDING', (0, 0), (-1, 0), 12),
-        ('BACKGROUND', (0, 1), (-1, -1), colors.beige),
-        ('GRID', (0, 0), (-1, -1), 1, colors.black)
-    ]))
+    metrics_table.setStyle(_METRICS_TABLE_STYLE)
     
     story.append(metrics_table)
     story.append(Spacer(1, 0.3*inch))
     
     if len(df) > 1:
         if language == 'en':
-            story.append(Paragraph("Monthly Trend Data", heading_style))
+            story.append(Paragraph("Monthly Trend Data", _HEADING_STYLE))
             trend_data = [['Month', 'Year', 'Households', 'Person-Days', 'Expenditure', 'Avg Wage']]
         else:
-            story.append(Paragraph("मासिक रुझान डेटा", heading_style))
+            story.append(Paragraph("मासिक रुझान डेटा", _HEADING_STYLE))
             trend_data = [['महीना', 'वर्ष', 'परिवार', 'कार्य दिवस', 'व्यय', 'वेतन']]
         
-        for _, row in df.head(6).iterrows():
-            trend_data.append([
-                get_month_name(row['month']),
-                str(row['year']),
-                f"{row['households']:,}",
-                f"{row['person_days']:,}",
-                format_indian_number(row['expenditure']),
-                f"₹{row['avg_wage']:.2f}"
-            ])
+        recent = df.head(6)
+        trend_months = [get_month_name(m) for m in recent['month'].tolist()]
+        trend_years = recent['year'].astype(str).tolist()
+        trend_households = [f"{v:,}" for v in recent['households'].tolist()]
+        trend_person_days = [f"{v:,}" for v in recent['person_days'].tolist()]
+        trend_expenditure = format_indian_number_array(recent['expenditure'].to_numpy())
+        trend_wages = [f"₹{v:.2f}" for v in recent['avg_wage'].tolist()]
+        
+        for row in zip(trend_months, trend_years, trend_households, trend_person_days, trend_expenditure, trend_wages):
+            trend_data.append(list(row))
         
         trend_table = Table(trend_data, colWidths=[1*inch, 0.7*inch, 1*inch, 1.2*inch, 1.2*inch, 1*inch])
-        trend_table.setStyle(TableStyle([
-            ('BACKGROUND', (0, 0), (-1, 0), colors.HexColor('#2ca02c')),
-            ('TEXTCOLOR', (0, 0), (-1, 0), colors.whitesmoke),
-            ('ALIGN', (0, 0), (-1, -1), 'CENTER'),
-            ('FONTNAME', (0, 0), (-1, 0), 'Helvetica-Bold'),
-            ('FONTSIZE', (0, 0), (-1, 0), 9),
-            ('FONTSIZE', (0, 1), (-1, -1), 8),
-            ('BOTTOMPADDING', (0, 0), (-1, 0), 8),
-            ('BACKGROUND', (0, 1), (-1, -1), colors.lightgrey),
-            ('GRID', (0, 0), (-1, -1), 0.5, colors.black)
-        ]))
+        trend_table.setStyle(_TREND_TABLE_STYLE)
         
         story.append(trend_table)
         story.append(Spacer(1, 0.2*inch))
@@ -407,7 +683,7 @@ def generate_pdf_report(district, state, df, language='en'):
         footer_text += "<br/>यह रिपोर्ट केवल सूचनात्मक उद्देश्यों के लिए तैयार की गई है।"
     
     story.append(Spacer(1, 0.3*inch))
-    story.append(Paragraph(footer_text, styles['Normal']))
+    story.append(Paragraph(footer_text, _STYLES['Normal']))
     
     doc.build(story)
     buffer.seek(0)